@@ -5,15 +5,46 @@
 # All rights reserved.
 
 import os
+import re
+import struct
 import logging
 
-from decimal import Decimal
-from pathlib import Path
+from itertools import islice
+from operator import itemgetter
+from typing import BinaryIO
 
-from file_processor.models import Document, Header, Transaction, Footer
+from file_processor.models import DELIMITER, Currency, Document, Header, Transaction, TransactionRaw, Footer
 
 _LOGGER = logging.getLogger("file_processor")
 
+# Amount field of a transaction holds 12 digits, used to split it from the preceding counter field
+_AMOUNT_BASE = 10**12
+
+# First two characters of each line identify the record type
+_RECORD_ID = itemgetter(slice(0, 2))
+# Counter and amount of a transaction, total counter and control sum of the footer: 18 digits after the record id
+_RECORD_DIGITS = itemgetter(slice(2, 20))
+
+# Fixed-offset fields of each line, the record id prefix is skipped
+_HEADER_STRUCT = struct.Struct("2x28s30s30s30s")
+# Counter and amount are read as one 18 digits field
+_TRANSACTION_STRUCT = struct.Struct("2x18s3s")
+_FOOTER_STRUCT = struct.Struct("2x6s12s")
+
+# Every record written by the models is 120 characters followed by the delimiter
+_RECORD_SIZE = _HEADER_STRUCT.size + len(DELIMITER)
+_DELIMITER_BYTES = DELIMITER.encode("ascii")
+
+_HEADER_FIELDS = ("name", "surname", "patrynomic", "address")
+
+_CURRENCIES = {currency.value.encode("ascii"): currency for currency in Currency}
+
+# Maximum number of buffers accepted by a single os.writev() call, POSIX guarantees at least 16
+try:
+    _IOV_MAX = max(os.sysconf("SC_IOV_MAX"), 16)
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 16
+
 
 def logging_init(file: str = None, level = logging.INFO) -> None:
     """Initializes logging."""
@@ -52,74 +83,217 @@ class FileProcessor:
             line_length (int): How long should the lines be.
             max_transactions (int): Maxiumum number of transactions allowed.
         """
-        self.__delimiter = delimiter
+        self.__delimiter = delimiter.encode("ascii")
         # 120 chars +1 for delimiter
         self.__line_length = line_length
+        self.__layout = self.__compile_layout(self.__delimiter, line_length)
+        # Lines are patched in place only when this processor reads the same fixed-width records the models write,
+        # and where positional reads and writes are available (not on Windows)
+        self.__in_place = (
+            self.__delimiter == _DELIMITER_BYTES
+            and line_length == _RECORD_SIZE
+            and hasattr(os, "pread")
+            and hasattr(os, "pwrite")
+        )
         self.__max_transactions = max_transactions
+        # Document last written by this processor, keyed by absolute path: (st_mtime_ns, st_size, document)
+        # Holds a single entry, which covers consecutive updates of one file without keeping every written file
+        self.__document_cache: dict[str, tuple[int, int, Document]] = {}
 
-    def __load_file_lines(self, path: str) -> list[str]:
-        """Reads the plain text from given path and returns it in format of lines.
+    @staticmethod
+    def __read_bytes(path: str) -> bytes:
+        """Reads the whole file using plain os calls: open, fstat and a single read sized to the file.
+
+        Skips the buffered file object of Path.read_bytes(), with its isatty and seek probes.
 
         Args:
             path (str): path to a file.
 
         Returns:
-            List of strings, each containing a separate line of file, without leading and trailing whitespace chars.
+            Raw content of the file.
+        """
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            # Ask for one byte more, a shorter read means the end of file was reached
+            content = os.read(fd, size + 1)
+            if len(content) <= size:
+                return content
+
+            # File grew since fstat, read the rest
+            chunks = [content]
+            while chunk := os.read(fd, 65536):
+                chunks.append(chunk)
+            return b"".join(chunks)
+        finally:
+            os.close(fd)
+
+    def __read_source(self, source: str | os.PathLike | BinaryIO) -> bytes:
+        """Reads the whole raw content of given path or binary file-like object.
+
+        Args:
+            source (str | os.PathLike | BinaryIO): path to a file or a binary file-like object, read from its current
+                position.
+
+        Returns:
+            Raw content of the file.
+
+        Raises:
+            ReadingException: When the file-like object is not opened in binary mode.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            return self.__read_bytes(os.fspath(source))
+
+        content = source.read()
+        if not isinstance(content, bytes):
+            _LOGGER.critical("File '%s' is not opened in binary mode!", source)
+            raise ReadingException(
+                f"Could not read '{source}', expected bytes from a binary file, got '{type(content).__name__}'!"
+            )
+
+        return content
+
+    @staticmethod
+    def __compile_layout(delimiter: bytes, line_length: int) -> re.Pattern[bytes]:
+        """Compiles the pattern of a whole valid file: a header line, at least one transaction line and a footer line,
+        none of them longer than `line_length`. Numeric fields of transactions and the footer have to be plain digits.
+
+        Args:
+            delimiter (bytes): End of line characters.
+            line_length (int): Maximum length of a line.
+
+        Returns:
+            Pattern to be fully matched against the stripped file content.
+        """
+        # "." matches anything but a newline, which is faster than an equivalent negated set
+        any_char = b"." if delimiter == b"\n" else b"[^" + re.escape(delimiter) + b"]"
+        header = b"01" + any_char + b"{0,%d}" % max(line_length - 2, 0)
+        # int() would accept a sign or underscores in the digit fields
+        digits_rest = b"[0-9]{18}" + any_char + b"{0,%d}" % max(line_length - 20, 0)
+        delimiter = re.escape(delimiter)
+
+        return re.compile(header + b"(?:" + delimiter + b"02" + digits_rest + b")+" + delimiter + b"03" + digits_rest)
+
+    def __load_file_content(self, path: str | os.PathLike | BinaryIO) -> bytes:
+        """Reads the raw content from given path and strips it.
+
+        Args:
+            path (str | os.PathLike | BinaryIO): path to a file or a binary file-like object.
+
+        Returns:
+            Content of the file, without leading and trailing whitespace chars.
 
         Raises:
             ValueError: When empty file was read.
+            ValidationException: When file contains non-ASCII characters.
         """
         _LOGGER.debug("Attempting to read '%s' file...", path)
         try:
-            # Strip whitespace characters from the beginning and end of the file
-            content = Path(path).read_text().strip()
-            if not content:
-                raise ValueError(f"File '{path} empty!")
-
-            return content.split(self.__delimiter)
+            # Read raw bytes, fields are parsed straight from them without decoding the whole file
+            content = self.__read_source(path)
 
         except FileNotFoundError as exc:
             _LOGGER.critical("File '%s' not found!", path)
             raise ReadingException(f"Could not read '{path}' file!") from exc
 
-    def __validate(self, lines: str) -> None:
+        if not content.isascii():
+            _LOGGER.critical("File '%s' contains non-ASCII characters!", path)
+            raise ValidationException(f"Validation failed! File '{path}' is not ASCII encoded!")
+
+        # Strip whitespace characters from the beginning and end of the file
+        content = content.strip()
+        if not content:
+            raise ValueError(f"File '{path} empty!")
+
+        return content
+
+    def __validate(self, content: bytes, lines: list[bytes]) -> None:
         """Validates the read content.
 
         Args:
-            lines (list[str]): text file content divided into lines.
+            content (bytes): text file content.
+            lines (list[bytes]): text file content divided into lines.
 
         Raises:
             ValidationException: When validation failed.
         """
         _LOGGER.debug("Beginning validation...")
 
-        for i, line in enumerate(lines):
+        # Layout of the whole content is matched in a single regex scan, lines are checked one by one only on failure
+        if self.__layout.fullmatch(content) is None:
+            self.__validate_lines(lines)
 
-            if len(line) > self.__line_length:
-                _LOGGER.error("Line '%s' exceeds the length limit!", i)
-                raise ValidationException(
-                    f"Validation failed! Document exceeds maximum '{self.__line_length}' line limit!"
-                )
+        # +2 for header and footer
+        if len(lines) > self.__max_transactions + 2:
+            raise ValidationException(
+                f"Validation failed! Exceeded maximum number of transactions ('{self.__max_transactions}')."
+            )
 
-        if not lines[0].startswith("01"):
+        _LOGGER.info("File validation successful!")
+
+    def __validate_lines(self, lines: list[bytes]) -> None:
+        """Validates the length and the record id of each line, pointing out the invalid one.
+
+        Args:
+            lines (list[bytes]): text file content divided into lines.
+
+        Raises:
+            ValidationException: When validation failed.
+        """
+        # Longest line is found in C, the offending line is looked up only when the check fails
+        if max(map(len, lines)) > self.__line_length:
+            i = next(i for i, line in enumerate(lines) if len(line) > self.__line_length)
+            _LOGGER.error("Line '%s' exceeds the length limit!", i)
+            raise ValidationException(f"Validation failed! Document exceeds maximum '{self.__line_length}' line limit!")
+
+        # Distinct record ids of all transaction lines are collected in C, the offending line is looked up on failure
+        if set(map(_RECORD_ID, lines[1:-1])) - {b"02"}:
+            i = next(i for i, line in enumerate(lines[1:-1], start=1) if _RECORD_ID(line) != b"02")
+            _LOGGER.error("Line '%s' is not a transaction!", i)
+            raise ValidationException(f"Validation failed! Invalid format of a transaction in line '{i}'!")
+
+        if _RECORD_ID(lines[0]) != b"01":
             raise ValidationException("Validation failed! Invalid format of first row!")
 
-        if not lines[-1].startswith("03"):
+        if _RECORD_ID(lines[-1]) != b"03":
             raise ValidationException("Validation failed! Invalid format of last row!")
 
-        # +2 for header and footer
-        if len(lines) > self.__max_transactions + 2:
-            raise ValidationException(
-                "Validation failed! Exceeded maximum number of transactions ('%s').", self.__max_transactions
-            )
+        if len(lines) < 3:
+            raise ValidationException("Validation failed! Document does not contain any transaction!")
 
-        # Verify that all transactions between header and footer have '02' prefix
-        if not any(x.startswith("02") for x in lines[1:-1]):
-            raise ValidationException("Validation failed! Invalid format of a transaction!")
+        # int() would accept a sign or underscores, numeric fields of transactions and the footer have to be digits
+        if not all(map(bytes.isdigit, map(_RECORD_DIGITS, lines[1:]))):
+            i = next(i for i, line in enumerate(lines[1:], start=1) if not _RECORD_DIGITS(line).isdigit())
+            _LOGGER.error("Line '%s' contains invalid numbers!", i)
+            raise ValidationException(f"Validation failed! Invalid numbers in line '{i}'!")
 
-        _LOGGER.info("File validation successful!")
+    @staticmethod
+    def __parse_header(line: bytes) -> Header:
+        """Constructs the Header from its fixed-offset fields."""
+        name, surname, patrynomic, address = _HEADER_STRUCT.unpack_from(line)
+
+        return Header(
+            name=name.decode("ascii"),
+            surname=surname.decode("ascii"),
+            patrynomic=patrynomic.decode("ascii"),
+            address=address.decode("ascii"),
+        )
+
+    @staticmethod
+    def __parse_footer(line: bytes) -> Footer:
+        """Constructs the Footer from its fixed-offset fields.
+
+        Raises:
+            ValueError: When the fields are not plain digits or do not fit the Footer model.
+        """
+        if not _RECORD_DIGITS(line).isdigit():
+            raise ValueError("Footer fields have to be digits!")
+
+        total_counter, control_sum_cents = _FOOTER_STRUCT.unpack_from(line)
 
-    def __get_document(self, lines: list[str]) -> Document:
+        return Footer(total_counter=int(total_counter), control_sum_cents=int(control_sum_cents))
+
+    def __get_document(self, lines: list[bytes]) -> Document:
         """Constructs a Document from given lines.
 
         Raises:
@@ -127,35 +301,43 @@ class FileProcessor:
         """
         _LOGGER.debug("Mapping file content into Document Models.")
         try:
-            header_line = lines[0]
-            header = Header(
-                name=header_line[2:30],
-                surname=header_line[30:60],
-                patrynomic=header_line[60:90],
-                address=header_line[90:120],
-            )
+            header = self.__parse_header(lines[0])
 
             transactions = []
-
-            for line in lines[1:-1]:
-                transactions.append(
-                    Transaction(
-                        counter=line[2:8],
-                        amount=float(int(line[8:20]) / 100),
-                        currency=line[20:23],
+            append_transaction = transactions.append
+            control_sum_cents = 0
+
+            # Parse the transactions and sum their amounts in the same pass
+            for i, line in enumerate(lines[1:-1], start=1):
+                digits, currency = _TRANSACTION_STRUCT.unpack_from(line)
+
+                # Counter and amount are adjacent digit fields, parse both with a single int() call
+                counter, amount_cents = divmod(int(digits), _AMOUNT_BASE)
+                control_sum_cents += amount_cents
+
+                # Counters are sequential, which also keeps them within the number of validated lines
+                if counter != i:
+                    _LOGGER.error("Transaction in line '%s' has counter '%s'!", i, counter)
+                    raise ValidationException(f"Validation failed! Invalid counter of a transaction in line '{i}'!")
+
+                # Line format and counter are validated, the amount fits its 12 digits and currency is looked up,
+                # so the Pydantic validation of every transaction is skipped
+                append_transaction(
+                    TransactionRaw(
+                        counter=counter,
+                        amount_cents=amount_cents,
+                        currency=_CURRENCIES[currency],
                     )
                 )
 
-            footer_line = lines[-1]
-            footer = Footer(
-                total_counter=footer_line[2:8],
-                control_sum=float(int(footer_line[8:20]) / 100),
-            )
+            footer = self.__parse_footer(lines[-1])
+        except ValidationException:
+            raise
         except Exception as exc:
             _LOGGER.critical("Failed to construct a Document from given text file.")
             raise ValidationException from exc
 
-        if transactions[-1].counter != footer.total_counter:
+        if transactions[-1].counter != footer.total_counter or control_sum_cents != footer.control_sum_cents:
             raise ValidationException("Number of transactions and control sum form footer mismatch!")
 
         return Document(
@@ -165,23 +347,22 @@ class FileProcessor:
         )
 
     @staticmethod
-    def __create_footer(transactions: list[Transaction]) -> Footer:
+    def __create_footer(transactions: list[Transaction | TransactionRaw]) -> Footer:
         """Creates a footer based on given transactions."""
-        control_sum = 0
-
-        for transaction in transactions:
-            control_sum += transaction.amount
+        control_sum_cents = sum(transaction.amount_cents for transaction in transactions)
 
-        return Footer(total_counter=len(transactions), control_sum=control_sum)
+        return Footer(total_counter=len(transactions), control_sum_cents=control_sum_cents)
 
-    def read(self, file: str) -> str:
-        """Read the contents of a file.
+    def read(self, file: str | os.PathLike | BinaryIO) -> Document:
+        """Read the contents of a file. A Document written by this processor is reused, if the file was not modified.
 
         Args:
-            file (str): Path to file.
+            file (str | os.PathLike | BinaryIO): Path to file or an already opened binary file-like object, e.g.
+                io.BytesIO.
 
         Returns:
-            str: File contents.
+            Document: File contents. Transactions are not validated by Pydantic, use `Document.to_validated()`
+                when Transaction models are needed.
 
         Raises:
             ValueError: When empty path was provided.
@@ -189,72 +370,332 @@ class FileProcessor:
         if not file:
             raise ValueError("No file path provided.")
 
-        lines = self.__load_file_lines(file)
-        self.__validate(lines)
+        # Only documents written to a path are cached
+        if isinstance(file, (str, os.PathLike)):
+            document = self.__take_cached_document(os.fspath(file))
+            if document is not None:
+                return document
+
+        content = self.__load_file_content(file)
+        lines = content.split(self.__delimiter)
+        self.__validate(content, lines)
 
         return self.__get_document(lines)
 
+    def __take_cached_document(self, file: str) -> Document | None:
+        """Returns the Document last written by this processor to given file and removes it from the cache.
+
+        The Document is returned only if the file was not modified since, so re-reading and re-validating it can be
+        skipped. Removing the entry hands the Document over to the caller, who is then free to mutate it.
+
+        Args:
+            file (str): Path to file.
+
+        Returns:
+            Cached Document or None, when the file is not cached or was modified.
+        """
+        entry = self.__document_cache.pop(os.path.abspath(file), None)
+        if entry is None:
+            return None
+
+        mtime_ns, size, document = entry
+        try:
+            stat = os.stat(file)
+        except FileNotFoundError:
+            return None
+
+        if (stat.st_mtime_ns, stat.st_size) != (mtime_ns, size):
+            _LOGGER.debug("File '%s' was modified since it was written, dropping cached document.", file)
+            return None
+
+        _LOGGER.debug("Using cached document of '%s' file.", file)
+        return document
+
+    @staticmethod
+    def __write_buffers(fd: int, buffers: list[bytes]) -> None:
+        """Writes all the buffers to given file descriptor, using os.writev() where available.
+
+        Args:
+            fd (int): File descriptor opened for writing.
+            buffers (list[bytes]): Consecutive chunks of the file content.
+        """
+        if not hasattr(os, "writev"):
+            buffers = [b"".join(buffers)]
+            batch_size = 1
+        else:
+            batch_size = _IOV_MAX
+
+        for start in range(0, len(buffers), batch_size):
+            batch = buffers[start : start + batch_size]
+            written = os.writev(fd, batch) if batch_size > 1 else os.write(fd, batch[0])
+
+            # Regular files are written in full, finish the batch with plain writes if the call was interrupted
+            if written < sum(map(len, batch)):
+                remaining = memoryview(b"".join(batch))[written:]
+                while remaining:
+                    remaining = remaining[os.write(fd, remaining) :]
+
     def __write_document_to_file(self, document: Document, file: str) -> None:
         """Writes the given document to a text file under specified path. Overwrites the file.
 
         Args:
             document (Document): Document which will be converted to a text file.
             file (str): Path to a file where document will be saved.
+
+        Raises:
+            WriteException: When document contains non-ASCII characters.
         """
         _LOGGER.debug("Attempting to write a '%s' file.", file)
 
-        content = ""
-        content += document.header.model_dump()
-
-        for transaction in document.transactions:
-            content += transaction.model_dump()
-
-        content += document.footer.model_dump()
+        # Encode every line separately and hand them to the kernel as they are, no need to build the whole file
+        # Call render() directly, model_dump() only adds Pydantic serializer overhead around it
+        try:
+            buffers = [document.header.render().encode("ascii")]
+            buffers.extend(transaction.render().encode("ascii") for transaction in document.transactions)
+            buffers.append(document.footer.render().encode("ascii"))
+        except UnicodeEncodeError as exc:
+            _LOGGER.critical("Document contains non-ASCII characters!")
+            raise WriteException(f"Could not write '{file}' file, document is not ASCII encodable!") from exc
 
         if os.path.exists(file):
             _LOGGER.debug("Overwriting '%s' file!", file)
 
-        Path(file).write_text(content)
+        fd = os.open(file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            self.__write_buffers(fd, buffers)
+        finally:
+            os.close(fd)
 
-    def update_transaction(self, file: str, id: int, amount: Decimal, currency: str) -> None:
+        # Keep the written document, so that the following read of the same file does not need to parse it again
+        # Documents of previously written files are dropped
+        stat = os.stat(file)
+        self.__document_cache = {os.path.abspath(file): (stat.st_mtime_ns, stat.st_size, document)}
+
+    def update_transaction(self, file: str, id: int, amount_cents: int, currency: str) -> None:
         """Updates the given transaction in the file.
 
         Args:
             file (str): Path to file.
             id (int): ID of the transaction to modify
-            amount (Decimal): new amount of transaction.
+            amount_cents (int): new amount of transaction, in cents.
             currency (str): new currency of transaction.
         """
         # Check if given id is greater than zero and between accepted amount of transactions
         if id <= 0 or id > self.__max_transactions:
             raise ValueError(f"'id' must be in a range of [0, {self.__max_transactions})! Got '{id}'.")
 
-        document = self.read(file)
+        new = Transaction(counter=id, amount_cents=amount_cents, currency=currency.upper())
 
-        # Chek if given id is present in the document
-        if id > document.footer.total_counter:
-            raise ValueError("'id' not present in the file!")
+        if not self.__update_transaction_in_place(file, new):
+            document = self.read(file)
 
-        new = Transaction(counter=id, amount=amount, currency=currency.upper())
+            # Chek if given id is present in the document
+            if id > document.footer.total_counter:
+                raise ValueError("'id' not present in the file!")
 
-        target_transaction = document.transactions[id - 1]
+            target_transaction = document.transactions[id - 1]
+            self.__log_currency_change(id, target_transaction.currency, new.currency)
 
-        if target_transaction.currency != new.currency:
-            _LOGGER.warning(
-                "Changing the currency of transaction with id = '%s' from '%s' to '%s'",
-                id,
-                target_transaction.currency,
-                new.currency,
-            )
+            document.transactions[id - 1] = new
 
-        document.transactions[id - 1] = new
+            # Update footer to match new transaction, only the amount of the replaced transaction changes
+            document.footer = Footer(
+                total_counter=document.footer.total_counter,
+                control_sum_cents=document.footer.control_sum_cents
+                - target_transaction.amount_cents
+                + new.amount_cents,
+            )
 
-        # Update footer to match new transaction
-        document.footer = self.__create_footer(document.transactions)
+            self.__write_document_to_file(document, file)
 
-        self.__write_document_to_file(document, file)
         _LOGGER.info("Successfully updated transaction with id = '%s'.", id)
 
+    @staticmethod
+    def __log_currency_change(id: int, old: Currency, new: Currency) -> None:
+        """Warns when the transaction update changes its currency."""
+        if old != new:
+            _LOGGER.warning("Changing the currency of transaction with id = '%s' from '%s' to '%s'", id, old, new)
+
+    @staticmethod
+    def __read_record(fd: int, offset: int, record_id: bytes) -> bytes | None:
+        """Reads a single fixed-width record at given offset.
+
+        Args:
+            fd (int): File descriptor opened for reading.
+            offset (int): Position of the record in the file.
+            record_id (bytes): Expected record id prefix.
+
+        Returns:
+            Record without the delimiter, None when there is no fixed-width record of given id at the offset.
+        """
+        line = os.pread(fd, _RECORD_SIZE, offset)
+        if len(line) != _RECORD_SIZE or _RECORD_ID(line) != record_id or not line.endswith(_DELIMITER_BYTES):
+            return None
+
+        return line[: -len(_DELIMITER_BYTES)]
+
+    def __read_fixed_width_footer(self, fd: int) -> Footer | None:
+        """Reads the footer of a file made of fixed-width records only.
+
+        Args:
+            fd (int): File descriptor opened for reading.
+
+        Returns:
+            Footer of the file, None when the header or the footer is not a fixed-width record, or when they do not
+            enclose exactly `total_counter` records.
+        """
+        footer_offset = os.fstat(fd).st_size - _RECORD_SIZE
+        footer_line = self.__read_record(fd, footer_offset, b"03") if footer_offset > 0 else None
+        if footer_line is None or self.__read_record(fd, 0, b"01") is None:
+            return None
+
+        try:
+            footer = self.__parse_footer(footer_line)
+        except ValueError:
+            return None
+
+        # Header, transactions and footer have to fill the file exactly
+        if footer_offset != _RECORD_SIZE * (footer.total_counter + 1):
+            return None
+
+        return footer
+
+    def __render_transaction_patch(self, fd: int, new: Transaction, footer: Footer) -> tuple[bytes, bytes] | None:
+        """Renders the records replacing the transaction with the same counter and the footer.
+
+        Args:
+            fd (int): File descriptor opened for reading.
+            new (Transaction): Transaction replacing the one with the same counter.
+            footer (Footer): Current footer of the file.
+
+        Returns:
+            New transaction and footer records, None when the current transaction is not a valid fixed-width record or
+            the new records do not fit its width.
+        """
+        line = self.__read_record(fd, _RECORD_SIZE * new.counter, b"02")
+        if line is None:
+            return None
+
+        digits, currency = _TRANSACTION_STRUCT.unpack_from(line)
+        if not digits.isdigit():
+            return None
+
+        try:
+            counter, amount_cents = divmod(int(digits), _AMOUNT_BASE)
+            new_footer = Footer(
+                total_counter=footer.total_counter,
+                control_sum_cents=footer.control_sum_cents - amount_cents + new.amount_cents,
+            )
+        except ValueError:
+            # Invalid numbers or control sum, leave it to the full read to report
+            return None
+
+        if counter != new.counter or currency not in _CURRENCIES:
+            return None
+
+        # A record of different width would overwrite the neighbouring records
+        records = (new.render().encode("ascii"), new_footer.render().encode("ascii"))
+        if any(len(record) != _RECORD_SIZE for record in records):
+            return None
+
+        self.__log_currency_change(new.counter, _CURRENCIES[currency], new.currency)
+        return records
+
+    def __update_transaction_in_place(self, file: str, new: Transaction) -> bool:
+        """Overwrites only the transaction line and the footer line of the file, adjusting the control sum by the
+        difference of amounts. Works when all the lines of the file are fixed-width, as written by this processor.
+
+        Args:
+            file (str): Path to file.
+            new (Transaction): Transaction replacing the one with the same counter.
+
+        Returns:
+            True when the transaction was updated, False when the whole document has to be rewritten instead.
+
+        Raises:
+            ValueError: When the transaction is not present in the file.
+        """
+        if not self.__in_place:
+            return False
+
+        try:
+            fd = os.open(file, os.O_RDWR)
+        except FileNotFoundError:
+            return False
+
+        try:
+            footer = self.__read_fixed_width_footer(fd)
+            if footer is None:
+                _LOGGER.debug("File '%s' is not made of fixed-width lines, rewriting the whole file.", file)
+                return False
+
+            if new.counter > footer.total_counter:
+                raise ValueError("'id' not present in the file!")
+
+            records = self.__render_transaction_patch(fd, new, footer)
+            if records is None:
+                return False
+
+            transaction_record, footer_record = records
+            os.pwrite(fd, transaction_record, _RECORD_SIZE * new.counter)
+            os.pwrite(fd, footer_record, _RECORD_SIZE * (footer.total_counter + 1))
+        finally:
+            os.close(fd)
+
+        # Cached document holds the previous transaction
+        self.__document_cache.pop(os.path.abspath(file), None)
+        _LOGGER.debug("Transaction with id = '%s' of '%s' file updated in place.", new.counter, file)
+        return True
+
+    def __update_header_in_place(self, file: str, updates: dict[str, str]) -> bool:
+        """Overwrites only the header line of the file, without reading and rewriting the transactions.
+
+        Works when the header is the fixed-width first line of the file, as written by this processor.
+
+        Args:
+            file (str): Path to file.
+            updates (dict[str, str]): Header fields to update.
+
+        Returns:
+            True when the header was updated, False when the whole document has to be rewritten instead.
+
+        Raises:
+            WriteException: When the new header contains non-ASCII characters.
+        """
+        if not self.__in_place:
+            return False
+
+        try:
+            fd = os.open(file, os.O_RDWR)
+        except FileNotFoundError:
+            return False
+
+        try:
+            line = self.__read_record(fd, 0, b"01")
+            if line is None:
+                _LOGGER.debug("Header of '%s' file is not a fixed-width line, rewriting the whole file.", file)
+                return False
+
+            try:
+                values = [value.decode("ascii") for value in _HEADER_STRUCT.unpack(line)]
+            except UnicodeDecodeError:
+                return False
+            current = dict(zip(_HEADER_FIELDS, values))
+
+            try:
+                new_line = Header(**{**current, **updates}).render().encode("ascii")
+            except UnicodeEncodeError as exc:
+                raise WriteException(f"Could not write '{file}' file, header is not ASCII encodable!") from exc
+
+            os.pwrite(fd, new_line, 0)
+        finally:
+            os.close(fd)
+
+        # Cached document holds the previous header
+        self.__document_cache.pop(os.path.abspath(file), None)
+        _LOGGER.debug("Header of '%s' file updated in place.", file)
+        return True
+
     def update_header(self, file: str, **kwargs) -> None:
         """Updates the data stored in a header.
         Args:
@@ -266,33 +707,29 @@ class FileProcessor:
             patrynomic (str): patrynomic of the client.
             address (str): address of the client.
         """
-        attribute_to_value_mapper = {
-            "name": kwargs.get("name", ""),
-            "surname": kwargs.get("surname", ""),
-            "patrynomic": kwargs.get("patrynomic", ""),
-            "address": kwargs.get("address", ""),
-        }
-
-        if not any(attribute_to_value_mapper.values()):
+        # Check the no-op case first, before touching the file
+        updates = {key: kwargs[key] for key in _HEADER_FIELDS if kwargs.get(key)}
+        if not updates:
             _LOGGER.debug("Data to update header not provided.")
             return
 
-        # Load the document and update it
-        document = self.read(file)
-        for key, value in attribute_to_value_mapper.items():
-            if value:
-                setattr(document.header, key, value)
+        if not self.__update_header_in_place(file, updates):
+            # Load the document and update it
+            document = self.read(file)
+            current = {key: getattr(document.header, key) for key in _HEADER_FIELDS}
+            document.header = Header(**{**current, **updates})
+
+            self.__write_document_to_file(document, file)
 
-        self.__write_document_to_file(document, file)
         _LOGGER.info("Successfully updated the header of '%s' file!", file)
 
-    def add_transaction(self, file: str, amount: Decimal, currency: str) -> None:
+    def add_transaction(self, file: str, amount_cents: int, currency: str) -> None:
         """Adds transaction to the file based on given amount and currency. Automatically calculates the index
         of transaction. Updates the footer. Check if maxiumum number of transactions was not exceeded.
 
         Args:
             file (str): Path to file.
-            amount (Decimal): amount of transaction.
+            amount_cents (int): amount of transaction, in cents.
             currency (str): currency of transaction.
         """
         document = self.read(file)
@@ -302,7 +739,7 @@ class FileProcessor:
 
         new = Transaction(
             counter=document.footer.total_counter + 1,
-            amount=amount,
+            amount_cents=amount_cents,
             currency=currency.upper(),
         )
         document.transactions.append(new)
@@ -325,14 +762,18 @@ class FileProcessor:
             raise ValueError(f"'id' must be in a range of [0, {document.footer.total_counter})! Got '{id}'.")
 
         # Delete the selected transaction
-        _LOGGER.debug("Deleting the transaction: '%s'", document.transactions[id - 1])
-        document.transactions.pop(id - 1)
+        deleted = document.transactions.pop(id - 1)
+        _LOGGER.debug("Deleting the transaction: '%s'", deleted)
 
-        # Decrement the ids of all transactions after selected
-        for transaction in document.transactions[id - 1 :]:
+        # Decrement the ids of all transactions after selected, islice iterates without copying the tail
+        for transaction in islice(document.transactions, id - 1, None):
             transaction.counter -= 1
 
-        document.footer = self.__create_footer(document.transactions)
+        # Only the deleted amount changes, no need to sum all the remaining transactions again
+        document.footer = Footer(
+            total_counter=document.footer.total_counter - 1,
+            control_sum_cents=document.footer.control_sum_cents - deleted.amount_cents,
+        )
 
         self.__write_document_to_file(document, file)
         _LOGGER.info("Successfully updated '%s' file!", file)
@@ -356,3 +797,6 @@ class FileProcessor:
             _LOGGER.debug("Overwirting '%s' file!", file)
 
         self.__write_document_to_file(document, file)
+
+        # Header and transactions are still referenced by the caller and may be modified, do not serve them from cache
+        self.__document_cache.pop(os.path.abspath(file), None)
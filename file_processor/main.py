@@ -29,6 +29,11 @@ logging_init(file="testlog.log", level=logging.INFO)
 
 # pylint: disable=too-many-arguments, too-many-positional-arguments
 
+def _to_cents(amount: float) -> int:
+    """Converts the amount given by user into integer cents, the only place where the float is handled."""
+    return int(round(amount * 100))
+
+
 @FILE_PROCESSOR_APP.command()
 def read(
     file: Annotated[str, Argument(help="File to read")],
@@ -70,7 +75,7 @@ def add(
     _LOGGER.debug("max_transactions '%s'", max_transactions)
 
     processor = FileProcessor(delimiter, line_length, max_transactions)
-    processor.add_transaction(file, amount, currency)
+    processor.add_transaction(file, _to_cents(amount), currency)
 
 
 @FILE_PROCESSOR_APP.command()
@@ -119,7 +124,7 @@ def update_transaction(
     _LOGGER.debug("max_transactions '%s'", max_transactions)
 
     processor = FileProcessor(delimiter, line_length, max_transactions)
-    processor.update_transaction(file, id, amount, currency)
+    processor.update_transaction(file, id, _to_cents(amount), currency)
 
 
 @FILE_PROCESSOR_APP_UPDATE.command(name="header")
@@ -6,11 +6,11 @@
 
 import logging
 
-from decimal import Decimal
 from enum import Enum
 from dataclasses import dataclass
+from typing import ClassVar
 
-from pydantic import BaseModel, Field, field_validator, model_serializer
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_serializer
 
 _LOGGER = logging.getLogger("models.py")
 
@@ -20,7 +20,10 @@ DELIMITER = "\n"
 
 class Header(BaseModel):
     """Represents Header in the Document/file."""
-    __lengths = {
+    # Header is always replaced as a whole, so instances can be shared between documents
+    model_config = ConfigDict(frozen=True)
+
+    __lengths: ClassVar[dict[str, int]] = {
         "name": 28,
         "surname": 30,
         "patrynomic": 30,
@@ -61,76 +64,86 @@ class Currency(str, Enum):
 
 class Transaction(BaseModel):
     """Represents Transaction in the Document/file."""
-    __lengths = {
+    __lengths: ClassVar[dict[str, int]] = {
         "counter": 6,
-        "amount": 12,
+        "amount_cents": 12,
         "currency": 3,
         "reserved": 97,
     }
+    # Padding is the same for every line, build it once instead of on every render
+    __padding: ClassVar[str] = __lengths["reserved"] * " "
     __counter_max = 20000
 
     field_id: str = Field(default="02", frozen=True)
     counter: int = Field(ge=1, le=__counter_max)
-    amount: Decimal = Field(ge=0)
+    # Cents are written as they are, so the amount has to fit the digits of its field
+    amount_cents: int = Field(ge=0, lt=10 ** __lengths["amount_cents"])
     currency: Currency = Field(min_length=1, max_length=__lengths["currency"])
     reserved: str = Field(default=" ", frozen=True)
 
-    @field_validator("amount", mode="before")
     @classmethod
-    def round_amount(cls, value: Decimal) -> Decimal:
-        """Convert the decimal number to desired precision."""
-        return round(value, 2)
-
-    @staticmethod
-    def amount_to_str(value: Decimal) -> str:
-        """Converts Decimal type into string without a separator, always taking two decimal points."""
-        return str(int(round(value, 2) * 100))
+    def format_line(cls, counter: int, amount_cents: int, currency: str) -> str:
+        """Returns the specifically formatted string for given transaction values."""
+        return (
+            "02"
+            f"{str(counter).rjust(cls.__lengths['counter'], '0')}"
+            f"{str(amount_cents).rjust(cls.__lengths['amount_cents'], '0')}"
+            f"{currency.rjust(cls.__lengths['currency'])}"
+            f"{cls.__padding}"
+            f"{DELIMITER}"
+        )
 
     @model_serializer
     def render(self) -> str:
         """Returns the specifically formatted string."""
-        return (
-            f"{self.field_id}"
-            f"{str(self.counter).rjust(self.__lengths['counter'], '0')}"
-            f"{self.amount_to_str(self.amount).rjust(self.__lengths['amount'], '0')}"
-            f"{self.currency.rjust(self.__lengths['currency'])}"
-            f"{self.__lengths['reserved'] * self.reserved}"
-            f"{DELIMITER}"
-        )
+        return self.format_line(self.counter, self.amount_cents, self.currency)
+
+
+@dataclass(slots=True)
+class TransactionRaw:
+    """Lightweight Transaction used on the read path, where the file content was already validated.
+
+    Skips the Pydantic validation, use `to_validated` when a full Transaction model is needed.
+    """
+
+    counter: int
+    amount_cents: int
+    currency: Currency
+
+    def render(self) -> str:
+        """Returns the specifically formatted string."""
+        return Transaction.format_line(self.counter, self.amount_cents, self.currency)
+
+    def to_validated(self) -> Transaction:
+        """Returns the Pydantic Transaction model built from the raw values."""
+        return Transaction(counter=self.counter, amount_cents=self.amount_cents, currency=self.currency)
 
 
 class Footer(BaseModel):
     """Represents Footer in the Document/file."""
-    __lengths = {
+    # Footer is always replaced as a whole, so instances can be shared between documents
+    model_config = ConfigDict(frozen=True)
+
+    __lengths: ClassVar[dict[str, int]] = {
         "total_counter": 6,
-        "control_sum": 12,
+        "control_sum_cents": 12,
         "reserved": 100,
     }
+    __padding: ClassVar[str] = __lengths["reserved"] * " "
 
     field_id: str = Field(default="03", frozen=True)
     total_counter: int = Field(ge=1)
-    control_sum: Decimal = Field(ge=0)
+    control_sum_cents: int = Field(ge=0, lt=10 ** __lengths["control_sum_cents"])
     reserved: str = Field(default=" ", frozen=True)
 
-    @field_validator("control_sum", mode="before")
-    @classmethod
-    def round_amount(cls, value: Decimal) -> Decimal:
-        """Convert the decimal number to desired precision."""
-        return round(value, 2)
-
-    @staticmethod
-    def amount_to_str(value: Decimal) -> str:
-        """Converts Decimal type into string without a separator, always taking two decimal points."""
-        return str(int(round(value, 2) * 100))
-
     @model_serializer
     def render(self) -> str:
         """Returns the specifically formatted string."""
         return (
             f"{self.field_id}"
             f"{str(self.total_counter).rjust(self.__lengths['total_counter'], '0')}"
-            f"{self.amount_to_str(self.control_sum).rjust(self.__lengths['control_sum'], '0')}"
-            f"{self.__lengths['reserved'] * self.reserved}"
+            f"{str(self.control_sum_cents).rjust(self.__lengths['control_sum_cents'], '0')}"
+            f"{self.__padding}"
             f"{DELIMITER}"
         )
 
@@ -140,7 +153,18 @@ class Document:
     """Represents document constructed of Header, list of Transactions and a Footer."""
 
     header: Header
-    transactions: list[Transaction]
+    transactions: list[Transaction | TransactionRaw]
     footer: Footer
 
+    def to_validated(self) -> "Document":
+        """Returns the Document with all raw transactions upgraded to validated Transaction models."""
+        return Document(
+            header=self.header,
+            transactions=[
+                transaction.to_validated() if isinstance(transaction, TransactionRaw) else transaction
+                for transaction in self.transactions
+            ],
+            footer=self.footer,
+        )
+
 # pylint: enable=no-member
@@ -0,0 +1,48 @@
+"""Fixtures shared by the unit tests."""
+
+# Copyright 2025 by Maciej Olszewski
+# https://github.com/machofvmaciek
+# All rights reserved.
+
+from typing import Callable
+
+import pytest
+
+from file_processor.file_processor import FileProcessor
+from file_processor.models import Header, Transaction, Footer, Document, Currency
+
+
+def _copy_document(document: Document) -> Document:
+    """Returns a copy of given document, so that the tests dont overwrite the original objects.
+
+    Header and Footer are frozen and shared, only the mutable transactions are copied.
+    """
+    return Document(
+        document.header, [transaction.model_copy() for transaction in document.transactions], document.footer
+    )
+
+
+@pytest.fixture(scope="session")
+def base_document() -> Document:
+    """Document with two transactions, validated once per session (or once per worker when run in parallel).
+
+    The document is shared, tests must not modify it.
+    """
+    return Document(
+        header=Header(name="John", surname="Doe", patrynomic="Smith", address="123 Main Street"),
+        transactions=[
+            Transaction(counter=1, amount_cents=100, currency=Currency.USD),
+            Transaction(counter=2, amount_cents=200, currency=Currency.USD),
+        ],
+        footer=Footer(total_counter=2, control_sum_cents=300),
+    )
+
+
+@pytest.fixture
+def mock_read(monkeypatch: pytest.MonkeyPatch) -> Callable[[Document], None]:
+    """Returns a function making `FileProcessor.read` return a fresh copy of given document on every call."""
+
+    def mock(document: Document) -> None:
+        monkeypatch.setattr(FileProcessor, "read", lambda *_: _copy_document(document))
+
+    return mock
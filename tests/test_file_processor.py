@@ -4,15 +4,17 @@
 # https://github.com/machofvmaciek
 # All rights reserved.
 
-import copy
+import io
+import os
 
-from decimal import Decimal
+from pathlib import Path
+from typing import Callable
 from unittest.mock import Mock, patch
 
 import pytest
 
 from file_processor.file_processor import FileProcessor, ReadingException, ValidationException, WriteException
-from file_processor.models import Header, Transaction, Footer, Document, Currency
+from file_processor.models import Header, Transaction, TransactionRaw, Footer, Document, Currency
 
 _TEST_FILE_1_TRANSACTION = """
 01                        John                           Doe                         Smith               123 Main Street
@@ -21,37 +23,77 @@ _TEST_FILE_1_TRANSACTION = """
 """
 
 _TEST_FILE_1_TRANSACTION_LINES = [
-    "01                        John                           Doe                         Smith               123 Main Street",
-    "02000001000000000100USD                                                                                                 ",
-    "03000001000000000100",
+    b"01                        John                           Doe                         Smith               123 Main Street",
+    b"02000001000000000100USD                                                                                                 ",
+    b"03000001000000000100",
 ]
 
-_TEST_FILE_1_TRANSACTION_LINES_TOO_LONG = _TEST_FILE_1_TRANSACTION_LINES + [122 * "-"]
-_TEST_FILE_1_TRANSACTION_LINES_INCORRECT_HEADER = [121 * "-"] + _TEST_FILE_1_TRANSACTION_LINES[1:]
-_TEST_FILE_1_TRANSACTION_LINES_INCORRECT_FOOTER = _TEST_FILE_1_TRANSACTION_LINES[:2] + [121 * "-"]
+_DASHES_121 = 121 * b"-"
+
+_TEST_FILE_1_TRANSACTION_LINES_TOO_LONG = (*_TEST_FILE_1_TRANSACTION_LINES, 122 * b"-")
+_TEST_FILE_1_TRANSACTION_LINES_INCORRECT_HEADER = (_DASHES_121, *_TEST_FILE_1_TRANSACTION_LINES[1:])
+_TEST_FILE_1_TRANSACTION_LINES_INCORRECT_FOOTER = (*_TEST_FILE_1_TRANSACTION_LINES[:2], _DASHES_121)
 _TEST_FILE_1_TRANSACTION_LINES_INCORRECT_TRANSACTION = (
-    _TEST_FILE_1_TRANSACTION_LINES[:1] + [121 * "-"] + _TEST_FILE_1_TRANSACTION_LINES[2:]
+    _TEST_FILE_1_TRANSACTION_LINES[0],
+    _DASHES_121,
+    _TEST_FILE_1_TRANSACTION_LINES[2],
 )
-
-_TEST_FILE_1_TRANSACTION_DOCUMENT = Document(
-    header=Header(field_id="01", name="John", surname="Doe", patrynomic="Smith", address="123 Main Street"),
-    transactions=[Transaction(field_id="02", counter=1, amount=Decimal("1.0"), currency=Currency.USD, reserved=" ")],
-    footer=Footer(field_id="03", total_counter=1, control_sum=Decimal("1.0"), reserved=" "),
+_TEST_FILE_1_TRANSACTION_LINES_INCORRECT_SECOND_TRANSACTION = (
+    *_TEST_FILE_1_TRANSACTION_LINES[:2],
+    b"04000002000000000100USD",
+    b"03000002000000000200",
+)
+_TEST_FILE_1_TRANSACTION_LINES_INCORRECT_CONTROL_SUM = (*_TEST_FILE_1_TRANSACTION_LINES[:2], b"03000001000000000200")
+_TEST_FILE_1_TRANSACTION_LINES_INCORRECT_CURRENCY = (
+    _TEST_FILE_1_TRANSACTION_LINES[0],
+    b"02000001000000000100XYZ",
+    _TEST_FILE_1_TRANSACTION_LINES[2],
+)
+# int() accepts a sign and underscores, such fields must not be parsed into different numbers
+_TEST_FILE_1_TRANSACTION_LINES_SIGNED_COUNTER = (
+    _TEST_FILE_1_TRANSACTION_LINES[0],
+    b"02-00000000000000100USD",
+    b"02000002000000000000USD",
+    b"03000002999999999900",
+)
+_TEST_FILE_1_TRANSACTION_LINES_UNDERSCORED_COUNTER = (
+    _TEST_FILE_1_TRANSACTION_LINES[0],
+    b"0200000_000000000100USD",
+    _TEST_FILE_1_TRANSACTION_LINES[2],
+)
+_TEST_FILE_1_TRANSACTION_LINES_UNDERSCORED_CONTROL_SUM = (
+    *_TEST_FILE_1_TRANSACTION_LINES[:2],
+    b"030000010000000_0100",
+)
+_TEST_FILE_1_TRANSACTION_LINES_COUNTER_OVER_MAX = (
+    _TEST_FILE_1_TRANSACTION_LINES[0],
+    b"02099999000000000100USD",
+    b"03099999000000000100",
 )
+_TEST_FILE_1_TRANSACTION_LINES_COUNTER_NOT_SEQUENTIAL = (
+    *_TEST_FILE_1_TRANSACTION_LINES[:2],
+    b"02000007000000000100USD",
+    b"03000007000000000200",
+)
+_TEST_FILE_1_TRANSACTION_LINES_NO_TRANSACTIONS = (_TEST_FILE_1_TRANSACTION_LINES[0], _TEST_FILE_1_TRANSACTION_LINES[2])
 
-_TEST_FOOTER_MAX_TRANSACTIONS_DOCUMENT = Document(
-    header=Header(field_id="01", name="John", surname="Doe", patrynomic="Smith", address="123 Main Street"),
-    transactions=[],
-    footer=Footer(field_id="03", total_counter=20000, control_sum=Decimal("1.0"), reserved=" "),
+# Fixtures hold known-good values, model_construct skips the validation at import
+_TEST_HEADER = Header.model_construct(
+    field_id="01", name="John", surname="Doe", patrynomic="Smith", address="123 Main Street"
 )
 
-_TEST_2_TRANSACTIONS_DOCUMENT = Document(
-    header=Header(field_id="01", name="John", surname="Doe", patrynomic="Smith", address="123 Main Street"),
+_TEST_FILE_1_TRANSACTION_DOCUMENT = Document(
+    header=_TEST_HEADER,
     transactions=[
-        Transaction(field_id="02", counter=1, amount=Decimal("1.0"), currency=Currency.USD, reserved=" "),
-        Transaction(field_id="02", counter=2, amount=Decimal("2.0"), currency=Currency.USD, reserved=" "),
+        Transaction.model_construct(field_id="02", counter=1, amount_cents=100, currency=Currency.USD, reserved=" ")
     ],
-    footer=Footer(field_id="03", total_counter=2, control_sum=Decimal("3.0"), reserved=" "),
+    footer=Footer.model_construct(field_id="03", total_counter=1, control_sum_cents=100, reserved=" "),
+)
+
+_TEST_FOOTER_MAX_TRANSACTIONS_DOCUMENT = Document(
+    header=_TEST_HEADER,
+    transactions=[],
+    footer=Footer.model_construct(field_id="03", total_counter=20000, control_sum_cents=100, reserved=" "),
 )
 
 
@@ -62,9 +104,17 @@ class TestFileProcessor:
     def processor(self) -> FileProcessor:
         return FileProcessor()
 
-    def get_document_copy(document: Document) -> Document:
-        """Returns a deepcopy of given document, so that the mocks dont overwrite the original objects."""
-        return copy.deepcopy(document)
+    @pytest.fixture(scope="session")
+    def parsed_document(self) -> Document:
+        """Document read from `_TEST_FILE_1_TRANSACTION_LINES`, parsed and validated once for the whole session.
+
+        The document is shared, tests must not modify it.
+        """
+        with patch(
+            "file_processor.file_processor.FileProcessor._FileProcessor__load_file_content",
+            Mock(return_value=b"\n".join(_TEST_FILE_1_TRANSACTION_LINES)),
+        ):
+            return FileProcessor().read("foo.txt").to_validated()
 
     @staticmethod
     def get_processor(delimiter: str = "\n", line_length: int = 121, max_transactions: int = 20000) -> FileProcessor:
@@ -77,42 +127,60 @@ class TestFileProcessor:
             processor.read("")
 
     @staticmethod
-    def test_read_load_file_lines_empty_file(processor: FileProcessor) -> None:
+    def test_read_load_file_content_empty_file(processor: FileProcessor) -> None:
         # Act & Assert
         with pytest.raises(ValueError):
-            with patch("pathlib.Path.read_text", return_value=""):
-                processor.read("foo.txt")
+            processor.read(io.BytesIO(b""))
 
     @staticmethod
-    def test_read_load_file_lines_file_missing(processor: FileProcessor) -> None:
+    def test_read_load_file_content_file_missing(processor: FileProcessor) -> None:
         # Act & Assert
         with pytest.raises(ReadingException):
-            with patch("pathlib.Path.read_text", side_effect=FileNotFoundError()):
+            with patch(
+                "file_processor.file_processor.FileProcessor._FileProcessor__read_bytes",
+                side_effect=FileNotFoundError(),
+            ):
                 processor.read("foo.txt")
 
+    @staticmethod
+    def test_read_load_file_content_not_ascii(processor: FileProcessor) -> None:
+        # Act & Assert
+        with pytest.raises(ValidationException):
+            processor.read(io.BytesIO(_TEST_FILE_1_TRANSACTION.replace("John", "Łukasz").encode()))
+
     @staticmethod
     @patch("file_processor.file_processor.FileProcessor._FileProcessor__validate")
-    def test_read_load_file_lines_success(mock_validate: Mock, processor: FileProcessor) -> None:
+    def test_read_load_file_content_success(mock_validate: Mock, processor: FileProcessor) -> None:
         # Act
-        with patch("pathlib.Path.read_text", return_value=_TEST_FILE_1_TRANSACTION):
-            processor.read("foo.txt")
+        processor.read(io.BytesIO(_TEST_FILE_1_TRANSACTION.encode("ascii")))
 
         # Assert
-        mock_validate.assert_called_once_with(_TEST_FILE_1_TRANSACTION_LINES)
+        mock_validate.assert_called_once_with(
+            b"\n".join(_TEST_FILE_1_TRANSACTION_LINES), _TEST_FILE_1_TRANSACTION_LINES
+        )
 
     @staticmethod
     @patch(
-        "file_processor.file_processor.FileProcessor._FileProcessor__load_file_lines",
-        Mock(return_value=_TEST_FILE_1_TRANSACTION_LINES),
+        "file_processor.file_processor.FileProcessor._FileProcessor__load_file_content",
+        Mock(return_value=b"\n".join(_TEST_FILE_1_TRANSACTION_LINES)),
     )
     def test_read_validate_success(processor: FileProcessor) -> None:
         # Act & Assert
         processor.read("foo.txt")
 
+    @staticmethod
+    @patch("file_processor.file_processor.FileProcessor._FileProcessor__validate_lines")
+    def test_read_validate_layout_match_skips_lines(mock_validate_lines: Mock, processor: FileProcessor) -> None:
+        # Act
+        processor.read(io.BytesIO(_TEST_FILE_1_TRANSACTION.encode("ascii")))
+
+        # Assert
+        mock_validate_lines.assert_not_called()
+
     @staticmethod
     @patch(
-        "file_processor.file_processor.FileProcessor._FileProcessor__load_file_lines",
-        Mock(return_value=_TEST_FILE_1_TRANSACTION_LINES_TOO_LONG),
+        "file_processor.file_processor.FileProcessor._FileProcessor__load_file_content",
+        Mock(return_value=b"\n".join(_TEST_FILE_1_TRANSACTION_LINES_TOO_LONG)),
     )
     def test_read_validate_line_too_long(processor: FileProcessor) -> None:
         # Act & Assert
@@ -126,68 +194,198 @@ class TestFileProcessor:
             (_TEST_FILE_1_TRANSACTION_LINES_INCORRECT_HEADER),
             (_TEST_FILE_1_TRANSACTION_LINES_INCORRECT_FOOTER),
             (_TEST_FILE_1_TRANSACTION_LINES_INCORRECT_TRANSACTION),
+            (_TEST_FILE_1_TRANSACTION_LINES_INCORRECT_SECOND_TRANSACTION),
+            (_TEST_FILE_1_TRANSACTION_LINES_NO_TRANSACTIONS),
+            (_TEST_FILE_1_TRANSACTION_LINES_INCORRECT_CONTROL_SUM),
+            (_TEST_FILE_1_TRANSACTION_LINES_INCORRECT_CURRENCY),
+            (_TEST_FILE_1_TRANSACTION_LINES_SIGNED_COUNTER),
+            (_TEST_FILE_1_TRANSACTION_LINES_UNDERSCORED_COUNTER),
+            (_TEST_FILE_1_TRANSACTION_LINES_UNDERSCORED_CONTROL_SUM),
+            (_TEST_FILE_1_TRANSACTION_LINES_COUNTER_OVER_MAX),
+            (_TEST_FILE_1_TRANSACTION_LINES_COUNTER_NOT_SEQUENTIAL),
         ],
     )
-    def test_read_validate_incorrect_ids(processor: FileProcessor, lines: list[str]) -> None:
+    def test_read_validate_incorrect_ids(processor: FileProcessor, lines: tuple[bytes, ...]) -> None:
         # Act & Assert
         with patch(
-            "file_processor.file_processor.FileProcessor._FileProcessor__load_file_lines", Mock(return_value=lines)
+            "file_processor.file_processor.FileProcessor._FileProcessor__load_file_content",
+            Mock(return_value=b"\n".join(lines)),
         ):
             with pytest.raises(ValidationException):
                 processor.read("foo.txt")
 
     @staticmethod
     @patch(
-        "file_processor.file_processor.FileProcessor._FileProcessor__load_file_lines",
-        Mock(return_value=_TEST_FILE_1_TRANSACTION_LINES),
+        "file_processor.file_processor.FileProcessor._FileProcessor__load_file_content",
+        Mock(return_value=b"\n".join(_TEST_FILE_1_TRANSACTION_LINES)),
     )
     @patch("file_processor.file_processor.FileProcessor._FileProcessor__validate", Mock())
     def test_read_get_document_success(processor: FileProcessor) -> None:
         document = processor.read("foo.txt")
 
-        assert document == _TEST_FILE_1_TRANSACTION_DOCUMENT
+        assert document.transactions == [TransactionRaw(counter=1, amount_cents=100, currency=Currency.USD)]
+        assert document.to_validated() == _TEST_FILE_1_TRANSACTION_DOCUMENT
+
+    @staticmethod
+    @patch(
+        "file_processor.file_processor.FileProcessor._FileProcessor__load_file_content",
+        Mock(
+            return_value=b"\n".join(
+                [_TEST_FILE_1_TRANSACTION_LINES[0], b"02000001999999999999USD", b"03000001999999999999"]
+            )
+        ),
+    )
+    def test_read_get_document_amount_exact(processor: FileProcessor) -> None:
+        # Act
+        document = processor.read("foo.txt")
+
+        # Assert
+        assert document.transactions[0].amount_cents == 999999999999
+        assert document.footer.control_sum_cents == 999999999999
 
     @staticmethod
-    @pytest.mark.parametrize("id", [(0), (20001), (2)])
     @patch(
-        "file_processor.file_processor.FileProcessor.read",
-        Mock(return_value=get_document_copy(_TEST_FILE_1_TRANSACTION_DOCUMENT)),
+        "file_processor.file_processor.FileProcessor._FileProcessor__update_transaction_in_place",
+        Mock(return_value=False),
     )
-    def test_update_transaction_wrong_id(processor: FileProcessor, id: int) -> None:
+    @pytest.mark.parametrize("id", [(0), (20001), (2)])
+    def test_update_transaction_wrong_id(
+        processor: FileProcessor, mock_read: Callable[[Document], None], parsed_document: Document, id: int
+    ) -> None:
+        # Arrange
+        mock_read(parsed_document)
+
         # Act & Assert
         with pytest.raises(ValueError):
             processor.update_transaction("foo.txt", id, 0, "USD")
 
     @staticmethod
     @patch(
-        "file_processor.file_processor.FileProcessor.read",
-        Mock(return_value=get_document_copy(_TEST_FILE_1_TRANSACTION_DOCUMENT)),
+        "file_processor.file_processor.FileProcessor._FileProcessor__update_transaction_in_place",
+        Mock(return_value=False),
     )
     @patch("file_processor.file_processor.FileProcessor._FileProcessor__write_document_to_file")
-    def test_update_transaction_success(mock_write_document: Mock, processor: FileProcessor) -> None:
+    def test_update_transaction_success(
+        mock_write_document: Mock,
+        processor: FileProcessor,
+        mock_read: Callable[[Document], None],
+        parsed_document: Document,
+    ) -> None:
         # Arrange
+        mock_read(parsed_document)
         id = 1
-        amount = 5
+        amount_cents = 500
         currency = "USD"
 
         expected_document = Document(
-            header=copy.deepcopy(_TEST_FILE_1_TRANSACTION_DOCUMENT.header),
+            header=_TEST_FILE_1_TRANSACTION_DOCUMENT.header,
             transactions=[
-                Transaction(field_id="02", counter=1, amount=Decimal("5.0"), currency=Currency.USD, reserved=" ")
+                Transaction(field_id="02", counter=1, amount_cents=500, currency=Currency.USD, reserved=" ")
             ],
-            footer=Footer(field_id="03", total_counter=1, control_sum=Decimal("5.0"), reserved=" "),
+            footer=Footer(field_id="03", total_counter=1, control_sum_cents=500, reserved=" "),
         )
 
         # Act
-        processor.update_transaction("foo.txt", id, amount, currency)
+        processor.update_transaction("foo.txt", id, amount_cents, currency)
 
         # Assert
         mock_write_document.assert_called_once_with(expected_document, "foo.txt")
 
+    @staticmethod
+    def test_update_transaction_in_place(processor: FileProcessor, tmp_path: Path) -> None:
+        # Arrange
+        file = str(tmp_path / "foo.txt")
+        processor.create(
+            file, _TEST_FILE_1_TRANSACTION_DOCUMENT.header, _TEST_FILE_1_TRANSACTION_DOCUMENT.transactions
+        )
+        expected_transaction = Transaction(counter=1, amount_cents=500, currency=Currency.USD)
+        expected_footer = Footer(total_counter=1, control_sum_cents=500)
+
+        # Act
+        with patch("file_processor.file_processor.FileProcessor.read") as mock_read:
+            processor.update_transaction(file, 1, 500, "usd")
+
+        # Assert
+        mock_read.assert_not_called()
+        document = processor.read(file)
+        assert document.to_validated().transactions == [expected_transaction]
+        assert document.footer == expected_footer
+
+    @staticmethod
+    def test_update_transaction_in_place_wrong_id(processor: FileProcessor, tmp_path: Path) -> None:
+        # Arrange
+        file = str(tmp_path / "foo.txt")
+        processor.create(
+            file, _TEST_FILE_1_TRANSACTION_DOCUMENT.header, _TEST_FILE_1_TRANSACTION_DOCUMENT.transactions
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            processor.update_transaction(file, 2, 500, "USD")
+
+    @staticmethod
+    @pytest.mark.parametrize("id, amount_cents", [(1, 10**12), (2, 10**12 - 1)])
+    def test_update_transaction_in_place_amount_too_big(
+        processor: FileProcessor, tmp_path: Path, id: int, amount_cents: int
+    ) -> None:
+        """Amount of the transaction or the resulting control sum does not fit its field, the file is left intact."""
+        # Arrange
+        file = tmp_path / "foo.txt"
+        transactions = [Transaction(counter=i, amount_cents=100, currency=Currency.USD) for i in range(1, 4)]
+        processor.create(str(file), _TEST_FILE_1_TRANSACTION_DOCUMENT.header, transactions)
+        content = file.read_bytes()
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            processor.update_transaction(str(file), id, amount_cents, "USD")
+
+        assert file.read_bytes() == content
+
+    @staticmethod
+    @pytest.mark.parametrize("function", ["pread", "pwrite"])
+    def test_update_transaction_no_positional_io(
+        monkeypatch: pytest.MonkeyPatch, tmp_path: Path, function: str
+    ) -> None:
+        # Arrange
+        file = str(tmp_path / "foo.txt")
+        FileProcessor().create(
+            file, _TEST_FILE_1_TRANSACTION_DOCUMENT.header, _TEST_FILE_1_TRANSACTION_DOCUMENT.transactions
+        )
+        monkeypatch.delattr(os, function)
+        processor = TestFileProcessor.get_processor()
+
+        # Act
+        with patch(
+            "file_processor.file_processor.FileProcessor._FileProcessor__write_document_to_file",
+            autospec=True,
+            side_effect=FileProcessor._FileProcessor__write_document_to_file,
+        ) as mock_write_document:
+            processor.update_transaction(file, 1, 500, "USD")
+
+        # Assert
+        mock_write_document.assert_called_once()
+        document = processor.read(file)
+        assert document.transactions[0].amount_cents == 500
+        assert document.footer == Footer(total_counter=1, control_sum_cents=500)
+
+    @staticmethod
+    def test_update_transaction_not_fixed_width(processor: FileProcessor, tmp_path: Path) -> None:
+        # Arrange
+        file = tmp_path / "foo.txt"
+        file.write_text(_TEST_FILE_1_TRANSACTION)
+
+        # Act
+        processor.update_transaction(str(file), 1, 500, "USD")
+
+        # Assert
+        document = processor.read(str(file))
+        assert document.transactions[0].amount_cents == 500
+        assert document.footer.control_sum_cents == 500
+
     @staticmethod
     @patch(
-        "file_processor.file_processor.FileProcessor.read",
-        Mock(return_value=get_document_copy(_TEST_FILE_1_TRANSACTION_DOCUMENT)),
+        "file_processor.file_processor.FileProcessor._FileProcessor__update_header_in_place",
+        Mock(return_value=False),
     )
     @patch("file_processor.file_processor.FileProcessor._FileProcessor__write_document_to_file")
     @pytest.mark.parametrize(
@@ -204,13 +402,19 @@ class TestFileProcessor:
         ],
     )
     def test_update_header_success(
-        mock_write_document: Mock, processor: FileProcessor, kwargs: dict[str, str], expected_header: Header
+        mock_write_document: Mock,
+        processor: FileProcessor,
+        mock_read: Callable[[Document], None],
+        parsed_document: Document,
+        kwargs: dict[str, str],
+        expected_header: Header,
     ) -> None:
         # Arrange
+        mock_read(parsed_document)
         expected_document = Document(
             expected_header,
-            copy.deepcopy(_TEST_FILE_1_TRANSACTION_DOCUMENT.transactions),
-            copy.deepcopy(_TEST_FILE_1_TRANSACTION_DOCUMENT.footer),
+            list(_TEST_FILE_1_TRANSACTION_DOCUMENT.transactions),
+            _TEST_FILE_1_TRANSACTION_DOCUMENT.footer,
         )
 
         # Act
@@ -220,73 +424,154 @@ class TestFileProcessor:
         mock_write_document.assert_called_once_with(expected_document, "foo.txt")
 
     @staticmethod
+    def test_update_header_in_place(processor: FileProcessor, tmp_path: Path) -> None:
+        # Arrange
+        file = str(tmp_path / "foo.txt")
+        processor.create(
+            file, _TEST_FILE_1_TRANSACTION_DOCUMENT.header, _TEST_FILE_1_TRANSACTION_DOCUMENT.transactions
+        )
+        expected_header = Header(name="Lucifer", surname="Doe", patrynomic="Smith", address="123 Main Street")
+
+        # Act
+        with patch("file_processor.file_processor.FileProcessor.read") as mock_read:
+            processor.update_header(file, name="lucifer ")
+
+        # Assert
+        mock_read.assert_not_called()
+        document = processor.read(file)
+        assert document.header == expected_header
+        assert document.to_validated().transactions == _TEST_FILE_1_TRANSACTION_DOCUMENT.transactions
+
+    @staticmethod
+    @pytest.mark.parametrize("delimiter, line_length", [(";", 121), ("\n", 200)])
+    def test_update_in_place_other_layout(tmp_path: Path, delimiter: str, line_length: int) -> None:
+        """Processor configured for another layout does not patch the file, the full read decides on it."""
+        # Arrange
+        file = tmp_path / "foo.txt"
+        FileProcessor().create(
+            str(file), _TEST_FILE_1_TRANSACTION_DOCUMENT.header, _TEST_FILE_1_TRANSACTION_DOCUMENT.transactions
+        )
+        processor = TestFileProcessor.get_processor(delimiter, line_length)
+
+        # Act
+        with patch("file_processor.file_processor.FileProcessor.read", side_effect=ValidationException()) as mock_read:
+            with pytest.raises(ValidationException):
+                processor.update_header(str(file), name="Lucifer")
+            with pytest.raises(ValidationException):
+                processor.update_transaction(str(file), 1, 500, "USD")
+
+        # Assert
+        assert mock_read.call_count == 2
+
+    @staticmethod
+    @pytest.mark.parametrize("function", ["pread", "pwrite"])
+    def test_update_header_no_positional_io(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, function: str) -> None:
+        # Arrange
+        file = str(tmp_path / "foo.txt")
+        FileProcessor().create(
+            file, _TEST_FILE_1_TRANSACTION_DOCUMENT.header, _TEST_FILE_1_TRANSACTION_DOCUMENT.transactions
+        )
+        monkeypatch.delattr(os, function)
+        processor = TestFileProcessor.get_processor()
+
+        # Act
+        with patch(
+            "file_processor.file_processor.FileProcessor._FileProcessor__write_document_to_file",
+            autospec=True,
+            side_effect=FileProcessor._FileProcessor__write_document_to_file,
+        ) as mock_write_document:
+            processor.update_header(file, name="Lucifer")
+
+        # Assert
+        mock_write_document.assert_called_once()
+        assert processor.read(file).header.name == "Lucifer"
+
+    @staticmethod
+    def test_update_header_not_fixed_width(processor: FileProcessor, tmp_path: Path) -> None:
+        # Arrange
+        file = tmp_path / "foo.txt"
+        file.write_text(_TEST_FILE_1_TRANSACTION)
+
+        # Act
+        processor.update_header(str(file), name="Lucifer")
+
+        # Assert
+        assert processor.read(str(file)).header.name == "Lucifer"
+
+    @staticmethod
+    @patch("file_processor.file_processor.FileProcessor._FileProcessor__update_header_in_place")
     @patch("file_processor.file_processor.FileProcessor._FileProcessor__write_document_to_file")
-    def test_update_header_empty_kwargs(mock_write_document: Mock, processor: FileProcessor) -> None:
+    def test_update_header_empty_kwargs(
+        mock_write_document: Mock, mock_update_header_in_place: Mock, processor: FileProcessor
+    ) -> None:
         # Act
         processor.update_header("foo.txt", **{})
 
         # Assert
+        mock_update_header_in_place.assert_not_called()
         mock_write_document.assert_not_called()
 
     @staticmethod
-    @patch(
-        "file_processor.file_processor.FileProcessor.read",
-        Mock(return_value=get_document_copy(_TEST_FOOTER_MAX_TRANSACTIONS_DOCUMENT)),
-    )
-    def test_add_transaction_exceeded_max(processor: FileProcessor) -> None:
+    def test_add_transaction_exceeded_max(processor: FileProcessor, mock_read: Callable[[Document], None]) -> None:
+        # Arrange
+        mock_read(_TEST_FOOTER_MAX_TRANSACTIONS_DOCUMENT)
+
         # Act & Assert
         with pytest.raises(WriteException):
-            processor.add_transaction("foo.txt", 1, "USD")
+            processor.add_transaction("foo.txt", 100, "USD")
 
     @staticmethod
-    @patch(
-        "file_processor.file_processor.FileProcessor.read",
-        Mock(return_value=get_document_copy(_TEST_2_TRANSACTIONS_DOCUMENT)),
-    )
     @patch("file_processor.file_processor.FileProcessor._FileProcessor__write_document_to_file")
-    def test_add_transaction_success(mock_write_document: Mock, processor: FileProcessor) -> None:
+    def test_add_transaction_success(
+        mock_write_document: Mock,
+        processor: FileProcessor,
+        mock_read: Callable[[Document], None],
+        base_document: Document,
+    ) -> None:
         # Arrange
-        amount = Decimal(3)
+        mock_read(base_document)
+        amount_cents = 300
         currency = "USD"
 
-        # Create a copy of the entry document
-        expected_document = copy.deepcopy(_TEST_2_TRANSACTIONS_DOCUMENT)
-        expected_document.transactions.append(Transaction(counter=3, amount=amount, currency=currency))
-        expected_document.footer = Footer(total_counter=3, control_sum=Decimal(6))
+        expected_document = Document(
+            base_document.header,
+            [*base_document.transactions, Transaction(counter=3, amount_cents=300, currency=currency)],
+            Footer(total_counter=3, control_sum_cents=600),
+        )
 
         # Act
-        processor.add_transaction("foo.txt", amount, currency)
+        processor.add_transaction("foo.txt", amount_cents, currency)
 
         # Assert
         mock_write_document.assert_called_once_with(expected_document, "foo.txt")
 
     @staticmethod
-    @patch(
-        "file_processor.file_processor.FileProcessor.read",
-        Mock(return_value=get_document_copy(_TEST_2_TRANSACTIONS_DOCUMENT)),
-    )
     @pytest.mark.parametrize("id", [(0), (3)])
-    def test_delete_transaction_wrong_id(processor: FileProcessor, id: int) -> None:
+    def test_delete_transaction_wrong_id(
+        processor: FileProcessor, mock_read: Callable[[Document], None], base_document: Document, id: int
+    ) -> None:
+        # Arrange
+        mock_read(base_document)
+
         # Act & Assert
         with pytest.raises(ValueError):
             processor.delete_transaction("foo.txt", id)
 
     @staticmethod
-    @patch(
-        "file_processor.file_processor.FileProcessor.read",
-        Mock(return_value=get_document_copy(_TEST_2_TRANSACTIONS_DOCUMENT)),
-    )
     @patch("file_processor.file_processor.FileProcessor._FileProcessor__write_document_to_file")
-    def test_delete_transaction_success_last_transaction(mock_write_document: Mock, processor: FileProcessor) -> None:
+    def test_delete_transaction_success_last_transaction(
+        mock_write_document: Mock,
+        processor: FileProcessor,
+        mock_read: Callable[[Document], None],
+        base_document: Document,
+    ) -> None:
         # Arrange
-        # Create a copy of the entry document
-        expected_document = copy.deepcopy(_TEST_2_TRANSACTIONS_DOCUMENT)
+        mock_read(base_document)
 
-        # Delete last transaction
-        expected_document.transactions.pop()
-
-        # Update the footer
-        expected_document.footer = Footer(total_counter=1, control_sum=Decimal(1))
+        # Last transaction deleted, footer updated
+        expected_document = Document(
+            base_document.header, base_document.transactions[:1], Footer(total_counter=1, control_sum_cents=100)
+        )
 
         # Act
         processor.delete_transaction("foo.txt", 2)
@@ -295,29 +580,27 @@ class TestFileProcessor:
         mock_write_document.assert_called_once_with(expected_document, "foo.txt")
 
     @staticmethod
-    @patch(
-        "file_processor.file_processor.FileProcessor.read",
-        Mock(return_value=get_document_copy(_TEST_2_TRANSACTIONS_DOCUMENT)),
-    )
     @patch("file_processor.file_processor.FileProcessor._FileProcessor__write_document_to_file")
-    def test_delete_transaction_success_middle_transaction(mock_write_document: Mock, processor: FileProcessor) -> None:
+    def test_delete_transaction_success_middle_transaction(
+        mock_write_document: Mock,
+        processor: FileProcessor,
+        mock_read: Callable[[Document], None],
+        base_document: Document,
+    ) -> None:
         """
         This test verifies if the middle transaction is deleted, the following ones have updated counters.
         For purpose of the easy testing, first transaction will be deleted, as from business perspective of the method
         behaviour should be the same.
         """
         # Arrange
-        # Create a copy of the entry document
-        expected_document = copy.deepcopy(_TEST_2_TRANSACTIONS_DOCUMENT)
-
-        # Delete first(middle-like) transaction
-        expected_document.transactions.pop(0)
+        mock_read(base_document)
 
-        # Update the counter of the left transaction
-        expected_document.transactions[0].counter = 1
-
-        # Update the footer
-        expected_document.footer = Footer(total_counter=1, control_sum=Decimal(2))
+        # First(middle-like) transaction deleted, the left transaction renumbered, footer updated
+        expected_document = Document(
+            base_document.header,
+            [Transaction(counter=1, amount_cents=200, currency=Currency.USD)],
+            Footer(total_counter=1, control_sum_cents=200),
+        )
 
         # Act
         processor.delete_transaction("foo.txt", 1)
@@ -335,3 +618,154 @@ class TestFileProcessor:
 
         # Assert
         mock_write_document.assert_called_once_with(_TEST_FILE_1_TRANSACTION_DOCUMENT, "foo.txt")
+
+    @staticmethod
+    def test_read_cached_document_after_write(processor: FileProcessor, tmp_path: Path) -> None:
+        # Arrange
+        file = str(tmp_path / "foo.txt")
+        Path(file).write_text(_TEST_FILE_1_TRANSACTION)
+
+        # Act
+        with patch(
+            "file_processor.file_processor.FileProcessor._FileProcessor__load_file_content",
+            autospec=True,
+            side_effect=FileProcessor._FileProcessor__load_file_content,
+        ) as mock_load_file_content:
+            processor.add_transaction(file, 200, "USD")
+            processor.add_transaction(file, 300, "USD")
+            document = processor.read(file)
+
+        # Assert
+        mock_load_file_content.assert_called_once()
+        assert document.footer == Footer(total_counter=3, control_sum_cents=600)
+
+    @staticmethod
+    def test_read_cached_document_file_modified(processor: FileProcessor, tmp_path: Path) -> None:
+        # Arrange
+        file = str(tmp_path / "foo.txt")
+        Path(file).write_text(_TEST_FILE_1_TRANSACTION)
+        processor.add_transaction(file, 200, "USD")
+
+        # Modify the file outside of the processor
+        Path(file).write_text(_TEST_FILE_1_TRANSACTION)
+        os.utime(file, ns=(0, 0))
+
+        # Act
+        document = processor.read(file)
+
+        # Assert
+        assert document.footer == Footer(total_counter=1, control_sum_cents=100)
+
+    @staticmethod
+    def test_read_cached_document_only_last_written_file(processor: FileProcessor, tmp_path: Path) -> None:
+        # Arrange
+        first, second = str(tmp_path / "foo.txt"), str(tmp_path / "bar.txt")
+        Path(first).write_text(_TEST_FILE_1_TRANSACTION)
+        Path(second).write_text(_TEST_FILE_1_TRANSACTION)
+        processor.add_transaction(first, 200, "USD")
+        processor.add_transaction(second, 300, "USD")
+
+        # Act
+        with patch(
+            "file_processor.file_processor.FileProcessor._FileProcessor__load_file_content",
+            autospec=True,
+            side_effect=FileProcessor._FileProcessor__load_file_content,
+        ) as mock_load_file_content:
+            first_document = processor.read(first)
+            second_document = processor.read(second)
+
+        # Assert
+        mock_load_file_content.assert_called_once_with(processor, first)
+        assert first_document.footer == Footer(total_counter=2, control_sum_cents=300)
+        assert second_document.footer == Footer(total_counter=2, control_sum_cents=400)
+
+    @staticmethod
+    def test_create_more_lines_than_single_write_batch(processor: FileProcessor, tmp_path: Path) -> None:
+        # Arrange
+        file = str(tmp_path / "foo.txt")
+        transactions = [Transaction(counter=i, amount_cents=i, currency=Currency.USD) for i in range(1, 2001)]
+
+        # Act
+        with patch("file_processor.file_processor._IOV_MAX", 16):
+            processor.create(file, _TEST_FILE_1_TRANSACTION_DOCUMENT.header, transactions)
+
+        # Assert
+        content = Path(file).read_text()
+        assert content.count("\n") == 2002
+        assert content.endswith(Footer(total_counter=2000, control_sum_cents=2001000).render())
+
+    @staticmethod
+    def test_create_not_ascii(processor: FileProcessor, tmp_path: Path) -> None:
+        # Arrange
+        file = tmp_path / "foo.txt"
+        file.write_text(_TEST_FILE_1_TRANSACTION)
+        header = Header(name="Łukasz", surname="Doe", patrynomic="Smith", address="123 Main Street")
+
+        # Act & Assert
+        with pytest.raises(WriteException):
+            processor.create(str(file), header, _TEST_FILE_1_TRANSACTION_DOCUMENT.transactions)
+
+        # Existing file is left untouched
+        assert file.read_text() == _TEST_FILE_1_TRANSACTION
+
+    @staticmethod
+    def test_read_file_on_disk(processor: FileProcessor, tmp_path: Path) -> None:
+        # Arrange
+        file = tmp_path / "foo.txt"
+        file.write_text(_TEST_FILE_1_TRANSACTION)
+
+        # Act
+        document = processor.read(str(file))
+
+        # Assert
+        assert document.to_validated() == _TEST_FILE_1_TRANSACTION_DOCUMENT
+
+    @staticmethod
+    def test_read_file_object(processor: FileProcessor) -> None:
+        # Arrange
+        file = io.BytesIO(_TEST_FILE_1_TRANSACTION.encode("ascii"))
+
+        # Act
+        document = processor.read(file)
+
+        # Assert
+        assert document.to_validated() == _TEST_FILE_1_TRANSACTION_DOCUMENT
+
+    @staticmethod
+    def test_read_path_object(processor: FileProcessor, tmp_path: Path) -> None:
+        # Arrange
+        file = tmp_path / "foo.txt"
+        file.write_text(_TEST_FILE_1_TRANSACTION)
+
+        # Act
+        document = processor.read(file)
+
+        # Assert
+        assert document.to_validated() == _TEST_FILE_1_TRANSACTION_DOCUMENT
+
+    @staticmethod
+    def test_read_path_object_cached_document(processor: FileProcessor, tmp_path: Path) -> None:
+        # Arrange
+        file = tmp_path / "foo.txt"
+        file.write_text(_TEST_FILE_1_TRANSACTION)
+        processor.add_transaction(str(file), 200, "USD")
+
+        # Act
+        with patch("file_processor.file_processor.FileProcessor._FileProcessor__load_file_content") as mock_load:
+            document = processor.read(file)
+
+        # Assert
+        mock_load.assert_not_called()
+        assert document.footer == Footer(total_counter=2, control_sum_cents=300)
+
+    @staticmethod
+    def test_read_text_file_object(processor: FileProcessor) -> None:
+        # Act & Assert
+        with pytest.raises(ReadingException):
+            processor.read(io.StringIO(_TEST_FILE_1_TRANSACTION))
+
+    @staticmethod
+    def test_read_file_missing_on_disk(processor: FileProcessor, tmp_path: Path) -> None:
+        # Act & Assert
+        with pytest.raises(ReadingException):
+            processor.read(str(tmp_path / "foo.txt"))
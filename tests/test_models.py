@@ -4,13 +4,11 @@
 # https://github.com/machofvmaciek
 # All rights reserved.
 
-from decimal import Decimal
-
 import pytest
 
 from pydantic import ValidationError
 
-from file_processor.models import Header, Transaction, Footer
+from file_processor.models import Header, Transaction, TransactionRaw, Footer
 
 
 class TestHeader:
@@ -47,16 +45,46 @@ class TestHeader:
             header.field_id = "new_id"
 
     @staticmethod
-    def test_init_fields_min_length() -> None:
+    def test_model_frozen() -> None:
+        # Arrange
+        header = TestHeader.get_header()
+
         # Act & Assert
         with pytest.raises(ValidationError):
-            Header(name="", surname="", patrynomic="", address="")
+            header.name = "Chloe"
 
     @staticmethod
-    def test_init_fields_max_length() -> None:
+    @pytest.mark.parametrize(
+        "overrides,should_raise",
+        [
+            ({}, False),
+            ({"name": 28 * "a", "surname": 30 * "a", "patrynomic": 30 * "a", "address": 30 * "a"}, False),
+            ({"name": ""}, True),
+            ({"surname": ""}, True),
+            ({"patrynomic": ""}, True),
+            ({"address": ""}, True),
+            ({"name": 29 * "a"}, True),
+            ({"surname": 31 * "a"}, True),
+            ({"patrynomic": 31 * "a"}, True),
+            ({"address": 31 * "a"}, True),
+        ],
+    )
+    def test_init_bounds(overrides: dict[str, str], should_raise: bool) -> None:
+        # Arrange
+        kwargs = {
+            "name": TestHeader.name,
+            "surname": TestHeader.surname,
+            "patrynomic": TestHeader.patrynomic,
+            "address": TestHeader.address,
+            **overrides,
+        }
+
         # Act & Assert
-        with pytest.raises(ValidationError):
-            Header(name=29 * "a", surname="", patrynomic="", address="")
+        if should_raise:
+            with pytest.raises(ValidationError):
+                Header(**kwargs)
+        else:
+            Header(**kwargs)
 
     @staticmethod
     def test_sanitize_strings_success() -> None:
@@ -98,15 +126,15 @@ class TestTransaction:
     """Unit-testing the Transaction"""
 
     counter = 1
-    amount = 10.50
-    amount_converted = "1050"
+    amount_cents = 1050
+    amount_converted = "000000001050"
     currency = "PLN"
 
     @staticmethod
     def get_transaction() -> Transaction:
         return Transaction(
             counter=TestTransaction.counter,
-            amount=TestTransaction.amount,
+            amount_cents=TestTransaction.amount_cents,
             currency=TestTransaction.currency,
         )
 
@@ -127,22 +155,34 @@ class TestTransaction:
             transaction.field_id = "new_id"
 
     @staticmethod
-    def test_init_min_max_values() -> None:
-        # Act & Assert
-        # All values in range
-        Transaction(counter=TestTransaction.counter, amount=TestTransaction.amount, currency=TestTransaction.currency)
-
-        # Counter below minimum
-        with pytest.raises(ValidationError):
-            Transaction(counter=-10, amount=TestTransaction.amount, currency=TestTransaction.currency)
-
-        # Counter over maxiumum
-        with pytest.raises(ValidationError):
-            Transaction(counter=20001, amount=TestTransaction.amount, currency=TestTransaction.currency)
+    @pytest.mark.parametrize(
+        "overrides,should_raise",
+        [
+            ({}, False),
+            ({"counter": 20000, "amount_cents": 0}, False),
+            ({"amount_cents": 10**12 - 1}, False),
+            ({"amount_cents": 10**12}, True),
+            ({"counter": 0}, True),
+            ({"counter": -10}, True),
+            ({"counter": 20001}, True),
+            ({"amount_cents": -1}, True),
+        ],
+    )
+    def test_init_bounds(overrides: dict[str, int], should_raise: bool) -> None:
+        # Arrange
+        kwargs = {
+            "counter": TestTransaction.counter,
+            "amount_cents": TestTransaction.amount_cents,
+            "currency": TestTransaction.currency,
+            **overrides,
+        }
 
-        # Amount below minimum
-        with pytest.raises(ValidationError):
-            Transaction(counter=TestTransaction.counter, amount=-1, currency=TestTransaction.currency)
+        # Act & Assert
+        if should_raise:
+            with pytest.raises(ValidationError):
+                Transaction(**kwargs)
+        else:
+            Transaction(**kwargs)
 
     @staticmethod
     @pytest.mark.parametrize(
@@ -157,44 +197,12 @@ class TestTransaction:
     def test_init_currency_supported(currency: str, success: bool) -> None:
         # Act & Assert
         if success:
-            Transaction(counter=TestTransaction.counter, amount=TestTransaction.amount, currency=currency)
+            Transaction(counter=TestTransaction.counter, amount_cents=TestTransaction.amount_cents, currency=currency)
         else:
             with pytest.raises(ValidationError):
-                Transaction(counter=TestTransaction.counter, amount=TestTransaction.amount, currency=currency)
-
-    @staticmethod
-    @pytest.mark.parametrize(
-        "amount,expected",
-        [
-            (5.1, Decimal(5.1)),
-            (5.11, Decimal(5.11)),
-            (5.111, Decimal(5.11)),
-            (5.16, Decimal(5.20)),
-        ],
-    )
-    def test_round_amount(amount: float, expected: Decimal) -> None:
-        # Act
-        transaction = Transaction(counter=TestTransaction.counter, amount=amount, currency=TestTransaction.currency)
-
-        assert transaction.amount.compare(expected)
-
-    @staticmethod
-    @pytest.mark.parametrize(
-        "value,expected",
-        [
-            (Decimal(5), "500"),
-            (Decimal(5.1), "510"),
-            (Decimal(5.11), "511"),
-            (Decimal(5.111), "511"),
-        ],
-    )
-    @staticmethod
-    def test_amount_to_str(value: Decimal, expected: str) -> None:
-        # Arrange
-        transaction = TestTransaction.get_transaction()
-
-        # Act & Assert
-        assert transaction.amount_to_str(value) == expected
+                Transaction(
+                    counter=TestTransaction.counter, amount_cents=TestTransaction.amount_cents, currency=currency
+                )
 
     @staticmethod
     def test_model_dump_render() -> None:
@@ -217,16 +225,48 @@ class TestTransaction:
         assert "\n" in result
 
 
+class TestTransactionRaw:
+    """Unit-testing the TransactionRaw."""
+
+    @staticmethod
+    def test_render_matches_transaction() -> None:
+        # Arrange
+        transaction = TestTransaction.get_transaction()
+        raw = TransactionRaw(
+            counter=transaction.counter, amount_cents=transaction.amount_cents, currency=transaction.currency
+        )
+
+        # Act & Assert
+        assert raw.render() == transaction.model_dump()
+
+    @staticmethod
+    def test_to_validated() -> None:
+        # Arrange
+        raw = TransactionRaw(counter=TestTransaction.counter, amount_cents=TestTransaction.amount_cents, currency="PLN")
+
+        # Act & Assert
+        assert raw.to_validated() == TestTransaction.get_transaction()
+
+    @staticmethod
+    def test_to_validated_invalid_values() -> None:
+        # Arrange
+        raw = TransactionRaw(counter=20001, amount_cents=TestTransaction.amount_cents, currency="PLN")
+
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            raw.to_validated()
+
+
 class TestFooter:
     """Unit-testing the footer class."""
 
     total_counter = 10
-    control_sum = 50.20
-    control_sum_converted = "5020"
+    control_sum_cents = 5020
+    control_sum_converted = "000000005020"
 
     @staticmethod
     def get_footer() -> Footer:
-        return Footer(total_counter=TestFooter.total_counter, control_sum=TestFooter.control_sum)
+        return Footer(total_counter=TestFooter.total_counter, control_sum_cents=TestFooter.control_sum_cents)
 
     @staticmethod
     def test_init_field_id_defaut_value_success() -> None:
@@ -245,52 +285,40 @@ class TestFooter:
             footer.field_id = "new_id"
 
     @staticmethod
-    def test_init_min_max_values() -> None:
-        # Act & Assert
-        # All values in range
-        Footer(total_counter=TestFooter.total_counter, control_sum=TestFooter.control_sum)
-
-        # Counter below minimum
-        with pytest.raises(ValidationError):
-            Footer(total_counter=0, control_sum=TestFooter.control_sum)
+    def test_model_frozen() -> None:
+        # Arrange
+        footer = TestFooter.get_footer()
 
-        # total_counter below minimum
+        # Act & Assert
         with pytest.raises(ValidationError):
-            Footer(total_counter=TestFooter.total_counter, control_sum=-1)
+            footer.total_counter = 1
 
     @staticmethod
     @pytest.mark.parametrize(
-        "amount,expected",
+        "overrides,should_raise",
         [
-            (5.1, Decimal(5.1)),
-            (5.11, Decimal(5.11)),
-            (5.111, Decimal(5.11)),
-            (5.16, Decimal(5.20)),
+            ({}, False),
+            ({"total_counter": 1, "control_sum_cents": 0}, False),
+            ({"control_sum_cents": 10**12 - 1}, False),
+            ({"control_sum_cents": 10**12}, True),
+            ({"total_counter": 0}, True),
+            ({"control_sum_cents": -1}, True),
         ],
     )
-    def test_round_amount(amount: float, expected: Decimal) -> None:
-        # Act
-        footer = Footer(total_counter=TestFooter.total_counter, control_sum=amount)
-
-        assert footer.control_sum.compare(expected)
-
-    @staticmethod
-    @pytest.mark.parametrize(
-        "value,expected",
-        [
-            (Decimal(5), "500"),
-            (Decimal(5.1), "510"),
-            (Decimal(5.11), "511"),
-            (Decimal(5.111), "511"),
-        ],
-    )
-    @staticmethod
-    def test_amount_to_str(value: Decimal, expected: str) -> None:
+    def test_init_bounds(overrides: dict[str, int], should_raise: bool) -> None:
         # Arrange
-        footer = TestFooter.get_footer()
+        kwargs = {
+            "total_counter": TestFooter.total_counter,
+            "control_sum_cents": TestFooter.control_sum_cents,
+            **overrides,
+        }
 
         # Act & Assert
-        assert footer.amount_to_str(value) == expected
+        if should_raise:
+            with pytest.raises(ValidationError):
+                Footer(**kwargs)
+        else:
+            Footer(**kwargs)
 
     @staticmethod
     def test_model_dump_render() -> None:
@@ -309,3 +337,20 @@ class TestFooter:
 
         assert whitespaces in result
         assert "\n" in result
+
+
+@pytest.mark.parametrize(
+    "model_cls,kwargs,cents_field",
+    [
+        (Transaction, {"counter": TestTransaction.counter, "currency": TestTransaction.currency}, "amount_cents"),
+        (Footer, {"total_counter": TestFooter.total_counter}, "control_sum_cents"),
+    ],
+)
+@pytest.mark.parametrize("cents", [(10.5), ("10.5"), ("abc")])
+def test_init_cents_not_integer(
+    model_cls: type[Transaction | Footer], kwargs: dict[str, object], cents_field: str, cents: object
+) -> None:
+    """Amounts of both Transaction and Footer are stored in integer cents."""
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        model_cls(**kwargs, **{cents_field: cents})